@@ -2,13 +2,23 @@ import collections
 import socket
 import threading
 import time
-import heapq
+from heapq import heappush as _heappush, heappop as _heappop
+import itertools
+import math
+import os
+import select
 from . import futures
 from .handlers import Handle, TimedHandle
-from typing import Any, Literal, Callable, Coroutine, List, NoReturn, Tuple, Union
-import selectors
+from typing import Any, Callable, Coroutine, Dict, Iterable, Iterator, List, NoReturn, Tuple, Union
 
 _MAX_SELECT_TIMEOUT = 5 * 3600
+_RECV_SIZE = 65536
+_RECVMMSG_COUNT = 64
+# same values as `selectors.EVENT_READ` and `selectors.EVENT_WRITE`
+EVENT_READ = 1
+EVENT_WRITE = 2
+EVENT_ONESHOT = 4
+_EVENT_RW = EVENT_READ | EVENT_WRITE
 Task = futures.Task
 Future = futures.Future
 
@@ -22,6 +32,418 @@ class _RunningLoops(threading.local):
 _loops = _Loops()
 _running_loop = _RunningLoops()
 
+class _Selector:
+
+    """
+    keeps track of registered file descriptors, changes are queued and only applied
+    right before polling so a register followed by an unregister in the same iteration
+    never reaches the kernel
+
+    registering with `EVENT_ONESHOT` keeps the fd registered but disarms it after it's
+    reported once, `arm` enables it again
+    """
+
+    # the backend flags that count as readable and writable
+    _read_flags: int = EVENT_READ
+    _write_flags: int = EVENT_WRITE
+    # whether the backend disarms `EVENT_ONESHOT` fds by itself once they're reported
+    _kernel_oneshot: bool = False
+
+    _keys: Dict[int, Tuple[int, Callable]]
+    _applied: Dict[int, int]
+    _pending_ctl: Dict[int, None]
+
+    def __init__(self) -> None:
+        self._keys = {}
+        self._applied = {}
+        self._pending_ctl = {}
+
+    def register(self, fd: int, events: int, data: Callable) -> None:
+        if fd in self._keys:
+            raise KeyError("{0} is already registered".format(fd))
+        self._keys[fd] = (events, data)
+        self._pending_ctl[fd] = None
+
+    def modify(self, fd: int, events: int, data: Callable) -> None:
+        if fd not in self._keys:
+            raise KeyError("{0} is not registered".format(fd))
+        self._keys[fd] = (events, data)
+        self._pending_ctl[fd] = None
+
+    def arm(self, fd: int, events: int) -> None:
+        key = self._keys.get(fd)
+        if key is None:
+            raise KeyError("{0} is not registered".format(fd))
+        self._keys[fd] = (events | EVENT_ONESHOT, key[1])
+        self._pending_ctl[fd] = None
+
+    def unregister(self, fd: int) -> None:
+        if fd not in self._keys:
+            raise KeyError("{0} is not registered".format(fd))
+        del self._keys[fd]
+        self._pending_ctl[fd] = None
+
+    def unregister_if(self, fd: int, data: Callable) -> bool:
+        """
+        unregister `fd` only if it's still registered with the callback `data`, returns whether it was
+        """
+        key = self._keys.get(fd)
+        if key is None or key[1] is not data:
+            return False
+        del self._keys[fd]
+        self._pending_ctl[fd] = None
+        return True
+
+    def select(self, timeout: Union[float, None], append: Callable[[Handle], None]) -> None:
+        """
+        wait for events and pass a Handle for every ready callback to `append`
+        """
+        if self._pending_ctl:
+            self._flush(append)
+        keys, applied, pending = self._keys, self._applied, self._pending_ctl
+        kernel_oneshot = self._kernel_oneshot
+        read_flags, write_flags = self._read_flags, self._write_flags
+        for fd, flags in self._poll(timeout):
+            key = keys.get(fd)
+            if key is None:
+                continue
+            events, data = key
+            mask = 0
+            if flags & read_flags:
+                mask = EVENT_READ
+            if flags & write_flags:
+                mask |= EVENT_WRITE
+            mask &= events
+            if not mask:
+                if kernel_oneshot and events & EVENT_ONESHOT:
+                    # disarmed by the kernel for something nobody waits for, arm it again
+                    applied[fd] = EVENT_ONESHOT
+                    pending[fd] = None
+                continue
+            if events & EVENT_ONESHOT:
+                keys[fd] = (EVENT_ONESHOT, data)
+                if kernel_oneshot:
+                    # already disarmed in the kernel, only re-arming has to reach it
+                    applied[fd] = EVENT_ONESHOT
+                else:
+                    pending[fd] = None
+            append(Handle(data, (fd, mask)))
+
+    def close(self) -> None:
+        self._keys.clear()
+        self._applied.clear()
+        self._pending_ctl.clear()
+
+    def _flush(self, append: Callable[[Handle], None]) -> None:
+        pending = self._pending_ctl
+        self._pending_ctl = {}
+        keys, applied = self._keys, self._applied
+        for fd in pending:
+            key = keys.get(fd)
+            current = applied.get(fd)
+            try:
+                if key is None:
+                    if current is not None:
+                        del applied[fd]
+                        self._ctl_del(fd)
+                elif current is None:
+                    applied[fd] = key[0]
+                    self._ctl_add(fd, key[0])
+                elif current != key[0]:
+                    applied[fd] = key[0]
+                    self._ctl_mod(fd, key[0])
+            except (OSError, ValueError, KeyError):
+                # one bad fd (usually closed behind our back) must not drop everyone else's
+                # changes, report it ready instead so its owner finds the error on its next call
+                applied.pop(fd, None)
+                if key is not None and key[0] & _EVENT_RW:
+                    if key[0] & EVENT_ONESHOT:
+                        keys[fd] = (EVENT_ONESHOT, key[1])
+                    append(Handle(key[1], (fd, key[0] & _EVENT_RW)))
+
+    def _ctl_add(self, fd: int, events: int) -> NoReturn:
+        raise NotImplementedError()
+
+    def _ctl_mod(self, fd: int, events: int) -> NoReturn:
+        raise NotImplementedError()
+
+    def _ctl_del(self, fd: int) -> NoReturn:
+        raise NotImplementedError()
+
+    def _poll(self, timeout: Union[float, None]) -> NoReturn:
+        raise NotImplementedError()
+
+class _EpollSelector(_Selector):
+
+    """
+    a selector that talks to `select.epoll` directly
+    """
+
+    # hangups and errors wake up both readers and writers
+    _read_flags = ~getattr(select, "EPOLLOUT", 0)
+    _write_flags = ~getattr(select, "EPOLLIN", 0)
+    _kernel_oneshot = True
+
+    _epoll: "select.epoll"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._epoll = select.epoll()
+
+    @staticmethod
+    def _to_epoll(events: int) -> int:
+        flags = 0
+        if events & EVENT_READ:
+            flags |= select.EPOLLIN
+        if events & EVENT_WRITE:
+            flags |= select.EPOLLOUT
+        if events & EVENT_ONESHOT or not flags:
+            # a disarmed fd still gets EPOLLHUP and EPOLLERR, this makes sure they wake us up at most once
+            flags |= select.EPOLLONESHOT
+        return flags
+
+    def _ctl_add(self, fd: int, events: int) -> None:
+        try:
+            self._epoll.register(fd, self._to_epoll(events))
+        except FileExistsError:
+            self._epoll.modify(fd, self._to_epoll(events))
+
+    def _ctl_mod(self, fd: int, events: int) -> None:
+        try:
+            self._epoll.modify(fd, self._to_epoll(events))
+        except FileNotFoundError:
+            # the fd was closed and its number reused before we got to unregister it
+            self._epoll.register(fd, self._to_epoll(events))
+
+    def _ctl_del(self, fd: int) -> None:
+        try:
+            self._epoll.unregister(fd)
+        except OSError:
+            pass
+
+    def _poll(self, timeout: Union[float, None]) -> Iterable[Tuple[int, int]]:
+        if timeout is None:
+            timeout = -1
+        elif timeout > 0:
+            # epoll has a millisecond resolution, round up so we don't wake up early
+            timeout = math.ceil(timeout * 1e3) * 1e-3
+        return self._epoll.poll(timeout, max(len(self._applied), 1))
+
+    def close(self) -> None:
+        super().close()
+        self._epoll.close()
+
+class _DefaultSelector(_Selector):
+
+    """
+    a fallback selector for platforms without epoll
+    """
+
+    _selector: "selectors.BaseSelector"
+
+    def __init__(self) -> None:
+        import selectors
+        super().__init__()
+        self._selector = selectors.DefaultSelector()
+
+    def _ctl_add(self, fd: int, events: int) -> None:
+        if events & _EVENT_RW:
+            self._selector.register(fd, events & _EVENT_RW)
+
+    def _ctl_mod(self, fd: int, events: int) -> None:
+        if not events & _EVENT_RW:
+            self._ctl_del(fd)
+            return
+        try:
+            self._selector.modify(fd, events & _EVENT_RW)
+        except KeyError:
+            self._selector.register(fd, events & _EVENT_RW)
+
+    def _ctl_del(self, fd: int) -> None:
+        try:
+            self._selector.unregister(fd)
+        except (KeyError, ValueError, OSError):
+            pass
+
+    def _poll(self, timeout: Union[float, None]) -> Iterable[Tuple[int, int]]:
+        return [(key.fd, mask) for key, mask in self._selector.select(timeout)]
+
+    def close(self) -> None:
+        super().close()
+        self._selector.close()
+
+def _new_selector() -> _Selector:
+    if hasattr(select, "epoll"):
+        return _EpollSelector()
+    return _DefaultSelector()
+
+_WHEEL_TICK = 1e-3
+_WHEEL_BITS = 6
+_WHEEL_SIZE = 1 << _WHEEL_BITS
+_WHEEL_LEVELS = 4
+
+class _TimerBucket:
+
+    """
+    an intrusive doubly linked list of TimedHandle, unlinking a handle is O(1)
+    """
+
+    _wheel: Union["TimerWheel", None]
+    _level: int
+    _slot: int
+    _head: Union[TimedHandle, None]
+    _tail: Union[TimedHandle, None]
+
+    def __init__(self, wheel: Union["TimerWheel", None]=None, level: int=0, slot: int=0) -> None:
+        self._wheel = wheel
+        self._level = level
+        self._slot = slot
+        self._head = None
+        self._tail = None
+
+    def __bool__(self) -> bool:
+        return self._head is not None
+
+    def append(self, handle: TimedHandle) -> None:
+        tail = self._tail
+        handle._prev = tail
+        handle._next = None
+        handle._bucket = self
+        if tail is None:
+            self._head = handle
+            if self._wheel is not None:
+                self._wheel._occupied[self._level] |= 1 << self._slot
+        else:
+            tail._next = handle
+        self._tail = handle
+
+    def unlink(self, handle: TimedHandle) -> None:
+        prev, next = handle._prev, handle._next
+        if prev is None:
+            self._head = next
+        else:
+            prev._next = next
+        if next is None:
+            self._tail = prev
+        else:
+            next._prev = prev
+        handle._prev = handle._next = handle._bucket = None
+        if self._head is None and self._wheel is not None:
+            self._wheel._occupied[self._level] &= ~(1 << self._slot)
+
+    def take(self) -> List[TimedHandle]:
+        handles = []
+        handle = self._head
+        while handle is not None:
+            next = handle._next
+            handle._prev = handle._next = handle._bucket = None
+            handles.append(handle)
+            handle = next
+        self._head = self._tail = None
+        if self._wheel is not None:
+            self._wheel._occupied[self._level] &= ~(1 << self._slot)
+        return handles
+
+class TimerWheel:
+
+    """
+    a hierarchical timing wheel with 4 levels of 64 buckets at 1 millisecond granularity,
+    adding and cancelling a TimedHandle is O(1), handles that are too far in the future
+    for the wheel are rejected by `add` and should be kept elsewhere
+    """
+
+    _current: int
+    _expired: _TimerBucket
+    _wheels: List[List[_TimerBucket]]
+    _occupied: List[int]
+
+    def __init__(self, now: float) -> None:
+        self._current = int(now / _WHEEL_TICK)
+        self._expired = _TimerBucket()
+        self._wheels = [
+            [_TimerBucket(self, level, slot) for slot in range(_WHEEL_SIZE)]
+            for level in range(_WHEEL_LEVELS)
+        ]
+        self._occupied = [0] * _WHEEL_LEVELS
+
+    def add(self, handle: TimedHandle) -> bool:
+        """
+        add a handle to the wheel, returns False if it's too far in the future
+        """
+        expires = math.ceil(handle._when / _WHEEL_TICK)
+        current = self._current
+        if expires <= current:
+            self._expired.append(handle)
+            return True
+        shift = 0
+        for wheel in self._wheels:
+            if (expires >> (shift + _WHEEL_BITS)) == (current >> (shift + _WHEEL_BITS)):
+                wheel[(expires >> shift) & (_WHEEL_SIZE - 1)].append(handle)
+                return True
+            shift += _WHEEL_BITS
+        return False
+
+    def next_expiry(self) -> Union[float, None]:
+        """
+        returns the time the wheel should be advanced next, this is either when the next
+        handle expires or when a higher level bucket has to be cascaded
+        """
+        if self._expired:
+            return 0.0
+        tick = self._next_tick()
+        if tick is None:
+            return None
+        return tick * _WHEEL_TICK
+
+    def advance(self, now: float) -> List[TimedHandle]:
+        """
+        advance the wheel to `now` and returns the handles that expired
+        """
+        target = int(now / _WHEEL_TICK)
+        expired = self._expired.take() if self._expired else []
+        while True:
+            tick = self._next_tick()
+            if tick is None or tick > target:
+                break
+            self._current = tick
+            self._cascade(tick)
+            bucket = self._wheels[0][tick & (_WHEEL_SIZE - 1)]
+            if bucket:
+                expired.extend(bucket.take())
+        if self._expired:
+            # cascading puts handles expiring on a block boundary here
+            expired.extend(self._expired.take())
+        if target > self._current:
+            self._current = target
+        return expired
+
+    def _next_tick(self) -> Union[int, None]:
+        current = self._current
+        best = None
+        shift = 0
+        for occupied in self._occupied:
+            if occupied:
+                index = (current >> shift) & (_WHEEL_SIZE - 1)
+                above = occupied >> (index + 1)
+                if above:
+                    slot = index + (above & -above).bit_length()
+                    block = shift + _WHEEL_BITS
+                    tick = ((current >> block) << block) | (slot << shift)
+                    if best is None or tick < best:
+                        best = tick
+            shift += _WHEEL_BITS
+        return best
+
+    def _cascade(self, tick: int) -> None:
+        for level in range(_WHEEL_LEVELS - 1, 0, -1):
+            shift = level * _WHEEL_BITS
+            if tick & ((1 << shift) - 1):
+                continue
+            bucket = self._wheels[level][(tick >> shift) & (_WHEEL_SIZE - 1)]
+            if bucket:
+                for handle in bucket.take():
+                    self.add(handle)
+
 class AbstractLoop:
 
     """
@@ -29,14 +451,20 @@ class AbstractLoop:
     consider subclassing BaseLoop for pre built functionality
     """
 
-    _timed_handlers: List[TimedHandle]
+    _timed_handlers: List[Tuple[float, int, TimedHandle]]
+    _timed_seq: Iterator[int]
+    _timer_wheel: TimerWheel
+    _clock: Callable[[], float]
     _handlers: collections.deque[Handle]
     _current_task: Task
     _closed: bool
     _stopping: bool
-    _selector: selectors.DefaultSelector
+    _selector: _Selector
     _ssock: socket.socket
     _csock: socket.socket
+    _efd: Union[int, None]
+    _wakeup_pending: bool
+    _recv_buffer: bytearray
     
     def __init__(self) -> None:
         pass
@@ -120,6 +548,9 @@ class AbstractLoop:
     def socket_recv(self, sock: socket.socket) -> NoReturn:
         raise NotImplementedError()
 
+    def socket_recvmmsg(self, sock: socket.socket, count: int) -> NoReturn:
+        raise NotImplementedError()
+
     def socket_send(self, sock: socket.socket) -> NoReturn:
         raise NotImplementedError()
 
@@ -138,9 +569,6 @@ class AbstractLoop:
     def _check_closed(self) -> NoReturn:
         raise NotImplementedError()
     
-    def _process_events(self, events: List[Tuple[selectors.SelectorKey, Union[Literal[1], Literal[2]]]]) -> NoReturn:
-        raise NotImplementedError()
-
     def _write_self(self) -> NoReturn:
         raise NotImplementedError()
     
@@ -159,12 +587,21 @@ class AbstractLoop:
 class BaseLoop(AbstractLoop):
 
     def __init__(self) -> None:
+        self._clock = time.monotonic
+        # entries are (when, seq, handle) so heapq compares them in C, seq breaks ties
+        # before the handles themselves are ever compared
         self._timed_handlers = []
+        self._timed_seq = itertools.count()
+        self._timer_wheel = TimerWheel(self._clock())
         self._handlers = collections.deque()
         self._current_task = None
         self._closed = False
         self._stopping = False
-        self._selector = selectors.DefaultSelector()
+        self._selector = _new_selector()
+        self._wakeup_pending = False
+        # every read goes through this buffer and is copied out before returning,
+        # which is safe since socket_recv never suspends
+        self._recv_buffer = bytearray(_RECV_SIZE)
         self._make_self_sock()
 
     def stop(self) -> None:
@@ -183,20 +620,55 @@ class BaseLoop(AbstractLoop):
     def socket_recv(self, sock: socket.socket) -> Union[bytes, None]:
         if sock.getblocking():
             raise RuntimeError("socket must not be blocking")
-        data = b""
+        buff = self._recv_buffer
+        view = memoryview(buff)
+        total = 0
         while True:
             try:
-                buff = sock.recv(4096)
-                if not buff:
-                    break
-                data += buff
+                n = sock.recv_into(view[total:])
+            except BlockingIOError:
+                if not total:
+                    view.release()
+                    return None
+                break
             except OSError:
                 break
-            except BlockingIOError:
-                return None
-            except:
-                raise
+            if not n:
+                break
+            total += n
+            if total == len(buff):
+                # a bytearray can't be resized while a view is exported
+                view.release()
+                buff.extend(bytes(len(buff)))
+                view = memoryview(buff)
+        data = view[:total].tobytes()
+        view.release()
+        if len(buff) > _RECV_SIZE:
+            # don't hold on to the memory of one large read
+            self._recv_buffer = bytearray(_RECV_SIZE)
         return data
+
+    def socket_recvmmsg(self, sock: socket.socket, count: int=_RECVMMSG_COUNT) -> List[bytes]:
+        """
+        receive up to `count` datagrams that are already queued on `sock` in one go,
+        every datagram is read into the loop's receive buffer, returns an empty list if nothing is queued
+        """
+        if sock.getblocking():
+            raise RuntimeError("socket must not be blocking")
+        # a 0 byte read is an empty datagram here, on a stream it would be EOF and we'd loop on it
+        if sock.type != socket.SOCK_DGRAM:
+            raise RuntimeError("socket must be a datagram socket")
+        view = memoryview(self._recv_buffer)
+        recv_into = sock.recv_into
+        messages = []
+        for _ in range(count):
+            try:
+                n = recv_into(view)
+            except OSError:
+                break
+            messages.append(view[:n].tobytes())
+        view.release()
+        return messages
     
     def _check_closed(self) -> Union[bool, NoReturn]:
         if self._closed:
@@ -204,24 +676,50 @@ class BaseLoop(AbstractLoop):
         return True
     
     def _make_self_sock(self) -> None:
+        if hasattr(os, "eventfd"):
+            # a single fd with an 8 byte counter is all we need to wake up the loop
+            self._efd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+            self._ssock = self._csock = None
+            self._selector.register(self._efd, EVENT_READ, self._read_self)
+            return
+        self._efd = None
         ssock, csock = socket.socketpair()
         ssock.setblocking(False)
         csock.setblocking(False)
         self._ssock, self._csock = ssock, csock
-        self._selector.register(ssock.fileno(), selectors.EVENT_READ, self._read_self)
+        self._selector.register(ssock.fileno(), EVENT_READ, self._read_self)
 
     
     def _write_self(self) -> None:
 
+        if self._wakeup_pending:
+            return
+        if self._efd is not None:
+            self._wakeup_pending = True
+            try:
+                os.eventfd_write(self._efd, 1)
+            except OSError:
+                pass
+            return
         csock = self._csock
         if not csock:
             return
+        self._wakeup_pending = True
         try:
             csock.send(b"\0")
         except:
             pass
     
     def _read_self(self, *args) -> None:
+        # cleared before draining so a wakeup written while we drain is never skipped,
+        # at worst two threads racing here both write a byte which is harmless
+        self._wakeup_pending = False
+        if self._efd is not None:
+            try:
+                os.eventfd_read(self._efd)
+            except OSError:
+                pass
+            return
         while True:
             try:
                 data = self._ssock.recv(4096)
@@ -245,7 +743,7 @@ class BaseLoop(AbstractLoop):
 
     def run_until_done(self, coro: Union[Coroutine, Task, Future]) -> Any:
         self._check_closed()
-        if not isinstance(coro, (Future, Task)):
+        if not isinstance(coro, Future):
             task = self.create_task(coro)
         else:
             task = coro
@@ -264,7 +762,8 @@ class BaseLoop(AbstractLoop):
     
     def _add_handle(self, handle: Union[Handle, TimedHandle]) -> None:
         if isinstance(handle, TimedHandle):
-            heapq.heappush(self._timed_handlers, handle)
+            if not self._timer_wheel.add(handle):
+                _heappush(self._timed_handlers, (handle._when, next(self._timed_seq), handle))
         elif isinstance(handle, Handle):
             self._handlers.append(handle)
     
@@ -274,16 +773,17 @@ class BaseLoop(AbstractLoop):
 
     def call_soon(self, fn: Callable, *args) -> Handle:
         handle = Handle(fn, args)
-        self._add_handle(handle)
+        self._handlers.append(handle)
         return handle
     
     def call_at(self, when: float, fn: Callable, *args) -> TimedHandle:
         handle = TimedHandle(when, fn, args)
-        self._add_handle(handle)
+        if not self._timer_wheel.add(handle):
+            _heappush(self._timed_handlers, (handle._when, next(self._timed_seq), handle))
         return handle
     
     def call_later(self, delay: Union[float, int], fn: Callable, *args) -> TimedHandle:
-        return self.call_at(self.time()+delay, fn, *args)
+        return self.call_at(self._clock()+delay, fn, *args)
     
     def call_soon_threadsafe(self, fn: Callable, *args) -> Handle:
         handle = self.call_soon(fn, *args)
@@ -291,42 +791,42 @@ class BaseLoop(AbstractLoop):
         return handle
     
     def time(self) -> float:
-        return time.monotonic()
+        return self._clock()
     
     def _run_once(self) -> None:
 
+        clock = self._clock
         timeout = None
         if self._handlers or self._stopping:
             timeout = 0
-        elif self._timed_handlers:
-            timeout = self._timed_handlers[0]._when
-            timeout = min(max(0, timeout-self.time()), _MAX_SELECT_TIMEOUT)
+        else:
+            when = self._timer_wheel.next_expiry()
+            if self._timed_handlers and (when is None or self._timed_handlers[0][0] < when):
+                when = self._timed_handlers[0][0]
+            if when is not None:
+                timeout = min(max(0, when-clock()), _MAX_SELECT_TIMEOUT)
         
         try:
-            events = self._selector.select(timeout)
-            self._process_events(events)
+            self._selector.select(timeout, self._handlers.append)
         except:
             pass
 
-        end = self.time()
-        while self._timed_handlers:
-            handle = self._timed_handlers[0]
-            if handle._when >= end:
-                break
-            handle = heapq.heappop(self._timed_handlers)
-            self._handlers.append(handle)
-        
-        for _ in range(len(self._handlers)):
-            handle: Union[Handle, TimedHandle] = self._handlers.popleft()
+        # the clock has to be read again after polling, reusing the time from before the poll
+        # would leave timers that expired while we were blocked for the next iteration
+        end = clock()
+        handlers = self._handlers
+        append = handlers.append
+        handlers.extend(self._timer_wheel.advance(end))
+        timed = self._timed_handlers
+        while timed and timed[0][0] < end:
+            handle = _heappop(timed)[2]
             if handle._cancelled:
                 continue
-            handle._run()
-
-        handle = None
-    
-    def _process_events(self, events: List[Tuple[selectors.SelectorKey, Union[Literal[1], Literal[2]]]]) -> None:
-        for key, mask in events:
-            self.call_soon(key.data, key.fileobj, mask)
+            append(handle)
+        
+        popleft = handlers.popleft
+        for _ in range(len(handlers)):
+            popleft()._run()
     
     def run_forever(self) -> None:
         self._check_closed()
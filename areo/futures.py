@@ -1,5 +1,6 @@
 from __future__ import annotations
 from . import base_loop
+from .handlers import Handle
 from typing import Any, Callable, Coroutine, Generator, List, NoReturn, Union
 import enum
 
@@ -12,6 +13,9 @@ _PENDING = State.PENDING
 _FINISHED = State.FINISHED
 _CANCELLED = State.CANCELLED
 
+# yielded by a Future that already registered the awaiting Task as its done callback
+_SUSPEND = object()
+
 class Future:
 
     """
@@ -23,9 +27,9 @@ class Future:
     _state: Union[_PENDING, _FINISHED, _CANCELLED]
     _result: Any
     _exception: Union[BaseException, None]
-    _callbacks: List[Callable[[Future]]]
     _cancel_msg: str
-    _callbacks: List[Callable[[Future]]]
+    # None, a single callback, or a list once a second one is added
+    _callbacks: Union[Callable[[Future]], List[Callable[[Future]]], None]
     
     def __init__(self, loop: base_loop.BaseLoop) -> None:
         self._loop = loop
@@ -33,28 +37,36 @@ class Future:
         self._result = None
         self._exception = None
         self._cancel_msg = "Future is cancelled"
-        self._callbacks = []
+        self._callbacks = None
 
     def __await__(self) -> Generator[Future, None, None]:
-        if not self.done():
-            yield self
-        if not self.done():
+        if self._state is _PENDING:
+            task = self._loop._current_task
+            if task is not None:
+                if self._callbacks is None:
+                    self._callbacks = task._step
+                else:
+                    self._add_callback(task._step)
+                yield _SUSPEND
+            else:
+                yield self
+        if self._state is _PENDING:
             raise RuntimeError("Future is not awaited")
         return self.result()
     
     def _check_done(self) -> Union[bool, NoReturn]:
-        if self._state != _PENDING:
+        if self._state is not _PENDING:
             raise RuntimeError("Future is done")
         return False
     
     def done(self) -> bool:
-        return self._state != _PENDING
+        return self._state is not _PENDING
     
     def cancelled(self) -> bool:
-        return self._state == _CANCELLED
+        return self._state is _CANCELLED
     
     def cancel(self, msg=None):
-        if self._state == _CANCELLED:
+        if self._state is _CANCELLED:
             return
         self._state = _CANCELLED
         self._cancel_msg = msg or self._cancel_msg
@@ -90,21 +102,34 @@ class Future:
     
     def _schedule_callbacks(self) -> None:
         
-        callbacks = self._callbacks[:]
-        if not callbacks:
+        callbacks = self._callbacks
+        if callbacks is None:
             return
-        self._callbacks = []
+        self._callbacks = None
 
-        for callback in callbacks:
-            self._loop.call_soon(callback, self)
+        if type(callbacks) is list:
+            if not callbacks:
+                return
+            self._loop._handlers.extend([Handle(callback, (self,)) for callback in callbacks])
+        else:
+            self._loop._handlers.append(Handle(callbacks, (self,)))
         self._loop._write_self()
+
+    def _add_callback(self, fn: Callable[[Future]]) -> None:
+        callbacks = self._callbacks
+        if callbacks is None:
+            self._callbacks = fn
+        elif type(callbacks) is list:
+            callbacks.append(fn)
+        else:
+            self._callbacks = [callbacks, fn]
     
     def add_done_callback(self, fn: Callable[[Future]]) -> None:
         """
         add a done callback to be ran after the future is finished or cancelled
         """
         self._check_done()
-        self._callbacks.append(fn)
+        self._add_callback(fn)
     
     def remove_done_callback(self, fn: Callable[[Future]]) -> None:
         """
@@ -112,8 +137,12 @@ class Future:
         then this function returns immediately
         """
         self._check_done()
-        if fn in self._callbacks:
-            self._callbacks.remove(fn)
+        callbacks = self._callbacks
+        if type(callbacks) is list:
+            if fn in callbacks:
+                callbacks.remove(fn)
+        elif callbacks is not None and callbacks == fn:
+            self._callbacks = None
     
     def set_result(self, res) -> None:
         """
@@ -159,16 +188,19 @@ class Task(Future):
     def set_exception(self, exc) -> NoReturn:
         raise RuntimeError("Task does not support setting exception")
     
-    def _step(self) -> None:
-        if self._state != _PENDING:
+    def _step(self, fut: Future=None) -> None:
+        if self._state is not _PENDING:
             return
         self._loop._current_task = self
         try:
             res = self._coro.send(None)
-            if isinstance(res, Future):
-                def _done(future: Future):
-                    self._step()
-                res.add_done_callback(_done)
+            if res is _SUSPEND:
+                pass
+            elif res is None:
+                # a bare yield, let everything else that's ready run before we continue
+                self._loop._handlers.append(Handle(self._step, ()))
+            elif isinstance(res, Future):
+                res.add_done_callback(self._step)
             else:
                 RuntimeError("got unexpected object '{0}'".format(type(res)))
         except StopIteration as exc:
@@ -1,5 +1,8 @@
 from __future__ import annotations
-from typing import Callable, List
+from typing import Any, Callable, List, Union
+
+def _noop(*args) -> None:
+    pass
 
 class Handle:
 
@@ -7,6 +10,8 @@ class Handle:
     a wrapper for callbacks in the event loop
     """
 
+    __slots__ = ("_fn", "_args", "_cancelled")
+
     _cancelled: bool
     _fn: Callable
     _args: List
@@ -33,7 +38,9 @@ class Handle:
             pass
 
     def cancel(self) -> None:
+        # the loop runs every queued handle without checking, so make it do nothing
         self._cancelled = True
+        self._fn = _noop
     
     def cancelled(self) -> bool:
         return self._cancelled
@@ -44,11 +51,19 @@ class TimedHandle(Handle):
     a timed handler which provides callback execution at a certain time
     """
 
+    __slots__ = ("_when", "_prev", "_next", "_bucket")
+
     _when: float
+    _prev: Union[TimedHandle, None]
+    _next: Union[TimedHandle, None]
+    _bucket: Any
 
     def __init__(self, when: float, fn: Callable, args: list) -> None:
         super().__init__(fn, args)
         self._when = when
+        self._prev = None
+        self._next = None
+        self._bucket = None
     
     def __repr__(self) -> str:
         start, end = "<{0} ".format(type(self).__name__), ">"
@@ -62,6 +77,11 @@ class TimedHandle(Handle):
     
     def when(self) -> float:
         return self._when
+
+    def cancel(self) -> None:
+        super().cancel()
+        if self._bucket is not None:
+            self._bucket.unlink(self)
     
     def __hash__(self) -> int:
         return hash(self.when())
@@ -1,14 +1,41 @@
 from __future__ import annotations
+import errno
+import functools
 import socket
-from typing import Coroutine, Tuple, Union
+import weakref
+from typing import Coroutine, List, Tuple, Union
 from . import base_loop
+from . import futures
 
 BaseLoop = base_loop.BaseLoop
+Future = futures.Future
+
+def _dispatch_ready(ref: weakref.ref, fd: int, mask: int) -> None:
+    sock = ref()
+    if sock is not None:
+        sock._on_ready(fd, mask)
+
+def _still_awaited(fut: Future) -> bool:
+    # every Task awaiting `fut` registered its bound `_step`, the ones that are done (usually
+    # cancelled by a timeout) would return right away so they don't count
+    callbacks = fut._callbacks
+    if callbacks is None:
+        return False
+    if type(callbacks) is not list:
+        callbacks = (callbacks,)
+    for fn in callbacks:
+        task = getattr(fn, "__self__", None)
+        if not isinstance(task, Future) or not task.done():
+            return True
+    return False
 
 class Socket:
 
     sock: socket.socket
     _loop: BaseLoop
+    _fd: int
+    _waiter: Future
+    _waiting: bool
 
     def __init__(self, sock: socket.socket, loop: BaseLoop=None) -> None:
         self.sock = sock
@@ -18,40 +45,70 @@ class Socket:
             self._loop = base_loop.get_loop()
             
         self._loop.socket_accept(sock)
+        self._fd = sock.fileno()
+        # one Future is reused for every wait on this socket
+        self._waiter = self._loop.create_future()
+        self._waiting = False
+        # the selector only holds a weak reference so a Socket that is never closed can still
+        # be collected, which closes its fd and drops the registration, unless the fd was handed
+        # to someone else in the meantime
+        selector = self._loop._selector
+        on_ready = functools.partial(_dispatch_ready, weakref.ref(self))
+        weakref.finalize(self, selector.unregister_if, self._fd, on_ready).atexit = False
+        selector.register(self._fd, base_loop.EVENT_ONESHOT, on_ready)
     
     def close(self) -> None:
+        try:
+            self._loop._selector.unregister(self._fd)
+        except KeyError:
+            pass
         self.sock.close()
+
+    def _on_ready(self, fd: int, mask: int) -> None:
+        if self._waiting:
+            self._waiting = False
+            self._waiter.set_result(mask)
+
+    def _wait(self, events: int) -> Future:
+        waiter = self._waiter
+        if self._waiting:
+            if _still_awaited(waiter):
+                raise RuntimeError("socket is already being waited on")
+            # whoever waited before is gone, take the waiter over
+            waiter._callbacks = None
+        waiter._state = futures._PENDING
+        waiter._result = None
+        waiter._exception = None
+        self._waiting = True
+        self._loop._selector.arm(self._fd, events)
+        return waiter
     
     async def connect(self, address: Union[Tuple, str, bytes]) -> Coroutine[Socket, None, None]:
         try:
             code = self.sock.connect_ex(address)
-            if not code in (0,10035):
+            if not code in (0, errno.EINPROGRESS, 10035):
                 raise RuntimeError(socket.errorTab[code])
         except:
             raise
 
-        waiter = self._loop.create_future()
-
-        def _done(key, mask):
-            waiter.set_result(True)
-
-        self._loop._selector.register(self.sock.fileno(), 1, _done)
-
-        await waiter
-        self._loop._selector.unregister(self.sock.fileno())
+        await self._wait(base_loop.EVENT_WRITE)
     
     async def recv(self, buffsize: int) -> Coroutine[bytes, None, None]:
 
-        waiter = self._loop.create_future()
-
-        def _done(key, mask):
-            waiter.set_result(True)
-
-        self._loop._selector.register(self.sock.fileno(), 1, _done)
-        await waiter
-        self._loop._selector.unregister(self.sock.fileno())
+        # try reading first, we only need to wait for the socket when it would block
         data = self._loop.socket_recv(self.sock)
+        while data is None:
+            await self._wait(base_loop.EVENT_READ)
+            data = self._loop.socket_recv(self.sock)
         return data
+
+    async def recvmmsg(self, count: int=base_loop._RECVMMSG_COUNT) -> Coroutine[List[bytes], None, None]:
+
+        messages = self._loop.socket_recvmmsg(self.sock, count)
+        while not messages:
+            await self._wait(base_loop.EVENT_READ)
+            messages = self._loop.socket_recvmmsg(self.sock, count)
+        return messages
     
     def __enter__(self) -> None:
         pass
@@ -1,80 +1,180 @@
-import inspect
-from typing import Any, Coroutine, List, Set, Tuple, Union
+import functools
+from types import CoroutineType as _CoroType
+from typing import Any, Coroutine, Generator, Iterable, List, Set, Tuple, Union
 from . import base_loop
+from .base_loop import get_loop as _get_loop
 from . import futures
 
 Future = futures.Future
 Task = futures.Task
 
-async def wait(fs: List[Union[Future, Task, Coroutine]], loop: base_loop.BaseLoop=None, timeout: Union[int, float]=None) -> Coroutine[Tuple[Set[Union[Future, Task]],Set[Union[Future, Task]]], None, None]:
+FIRST_COMPLETED = "FIRST_COMPLETED"
+ALL_COMPLETED = "ALL_COMPLETED"
+
+class _WaitState:
 
     """
-    wait for multiple Future to be completed, if `fs` contains a coroutine it will be scheduled as a Task,
-    returns a tuple containing 2 set of `done` and `pending` futures
+    the bookkeeping of a single `wait` call, its bound methods are used as the callbacks
+    """
+
+    __slots__ = ("counts", "first", "done", "pending", "waiter", "handle")
+
+    counts: int
+    first: bool
+    done: List[Union[Future, Task]]
+    pending: List[Union[Future, Task]]
+    waiter: Future
+    handle: Union[base_loop.TimedHandle, None]
+
+    def __init__(self, first: bool) -> None:
+        self.counts = 0
+        self.first = first
+        self.done = []
+        self.pending = []
+        self.waiter = None
+        self.handle = None
+
+    def on_done(self, fut: Union[Future, Task]) -> None:
+        if self.waiter.done():
+            return
+        self.counts -= 1
+        self.done.append(fut)
+        if self.first or self.counts <= 0:
+            # the timeout timer holds on to us, don't leave it in the wheel until it expires
+            if self.handle is not None:
+                self.handle.cancel()
+            self.waiter.set_result(True)
+
+    def on_timeout(self) -> None:
+        if self.waiter.done():
+            return
+        for fut in self.detach():
+            fut.cancel()
+        self.waiter.set_result(True)
+
+    def detach(self) -> List[Union[Future, Task]]:
+        """
+        removes `on_done` from the unfinished futures and returns them
+        """
+        on_done = self.on_done
+        unfinished = []
+        for fut in self.pending:
+            if not fut.done():
+                fut.remove_done_callback(on_done)
+                unfinished.append(fut)
+        return unfinished
+
+class _YieldOnce:
 
-    if timeout is provided this function will return the result immediately and any pending Future will be added
-    in the `pending` set
+    """
+    gives control back to the event loop once, a bare yield makes the running Task reschedule itself
     """
 
-    assert isinstance(timeout, (int, float)) or timeout is None
+    __slots__ = ()
 
-    if loop is None:
-        loop = base_loop.get_loop()
+    def __await__(self) -> Generator[None, None, None]:
+        yield
 
-    for fut in fs:
-        if not (isinstance(fut, (Future, Task)) or inspect.iscoroutine(fut)):
-            raise ValueError("expected Future, Task, or Coroutine. got '{0}' instead".format(type(fut)))
+_YIELD = _YieldOnce()
 
-    counts = len(fs)
+async def wait(fs: Iterable[Union[Future, Task, Coroutine]], loop: base_loop.BaseLoop=None, timeout: Union[int, float]=None, return_when: str=ALL_COMPLETED) -> Coroutine[Tuple[Set[Union[Future, Task]],Set[Union[Future, Task]]], None, None]:
 
-    waiter = loop.create_future()
-    done: Set[Union[Future, Task]] = set()
-    pending: Set[Union[Future, Task]] = set()
-
-    def _on_completion(fut):
-        nonlocal counts
-        counts -= 1
-        done.add(fut)
-        if counts <= 0:
-            waiter.set_result(True)
-    
-    def _timeout():
-        waiter.set_result(True)
-        nonlocal pending, done
-        pending = done ^ pending
-    
+    """
+    wait for multiple Future to be completed, `fs` can be any iterable (a generator works too), if `fs` contains
+    a coroutine it will be scheduled as a Task,
+    returns a tuple containing 2 set of `done` and `pending` futures
+
+    if timeout is provided this function will return the result immediately and any pending Future will be cancelled
+    and added in the `pending` set
+
+    `return_when` can be `FIRST_COMPLETED` to return as soon as any Future is done, the rest are left running
+    and returned in the `pending` set
+    """
+
+    if return_when != ALL_COMPLETED and return_when != FIRST_COMPLETED:
+        raise ValueError("invalid return_when value '{0}'".format(return_when))
 
+    if loop is None:
+        loop = _get_loop()
+
+    # done and pending are lists while waiting, the sets are only built once we return
+    state = _WaitState(return_when == FIRST_COMPLETED)
+    done = state.done
+    pending = state.pending
+    on_done = state.on_done
+
+    create_task = loop.create_task
+    pending_add = pending.append
+    created = []
+    cnt = 0
     for fut in fs:
-        if inspect.iscoroutine(fut):
-            fut = loop.create_task(fut)
-        fut.add_done_callback(_on_completion)
-        pending.add(fut)
+        if isinstance(fut, Future):
+            pass
+        elif isinstance(fut, _CoroType):
+            fut = create_task(fut)
+            created.append(fut)
+        else:
+            # validation is fused with scheduling, so undo what this call already did before raising:
+            # the tasks we made haven't stepped yet and cancelling them keeps their coroutines from running
+            state.detach()
+            for task in created:
+                task.cancel()
+            raise ValueError("expected Future, Task, or Coroutine. got '%r' instead" % (type(fut),))
+        if fut.done():
+            done.append(fut)
+            continue
+        fut._add_callback(on_done)
+        pending_add(fut)
+        cnt += 1
+    state.counts = cnt
+
+    # nothing to wait for, don't bother going through the loop
+    if not cnt:
+        return set(done), set()
+    if state.first and done:
+        return set(done), set(state.detach())
+
+    waiter = state.waiter = loop.create_future()
 
     if timeout:
-        loop.call_later(timeout, _timeout)
-    
+        state.handle = loop.call_later(timeout, state.on_timeout)
 
     await waiter
-    return done, pending
+    if state.handle is not None:
+        state.handle.cancel()
+    done_set = set(done)
+    if state.first:
+        state.detach()
+        # others might have finished in the same iteration without reaching `on_done`
+        done_set.update(fut for fut in pending if fut.done())
+    return done_set, set(pending).difference(done_set)
 
 async def sleep(delay: Union[int, float], result=True, loop: base_loop.BaseLoop=None) -> Coroutine[Any, None, None]:
 
     """
     sleep for `delay` seconds, this actually reschedule the Task to be run later rather than
     actually sleeping which will block the thread and make everything stop working
+
+    `sleep(0)` just yields to the loop once without scheduling anything
     """
+
+    if delay <= 0:
+        await _YIELD
+        return result
     
     if loop is None:
-        loop = base_loop.get_loop()
+        loop = _get_loop()
 
     waiter = loop.create_future()
-
-    if delay <= 0:
-        loop.call_soon(waiter.set_result, result)
-    else:
-        loop.call_later(delay, waiter.set_result, result)
+    loop.call_later(delay, waiter.set_result, result)
     return await waiter
 
+def _wait_for_done(waiter: Future, handle: base_loop.TimedHandle, fut: Union[Future, Task]) -> None:
+    if waiter.done():
+        return
+    handle.cancel()
+    waiter.set_result(True)
+
 async def wait_for(fut: Union[Future, Task, Coroutine], timeout: Union[int, float], loop: base_loop.BaseLoop=None) -> Coroutine[Any, None, None]:
 
     """
@@ -84,22 +184,23 @@ async def wait_for(fut: Union[Future, Task, Coroutine], timeout: Union[int, floa
     """
 
     if loop is None:
-        loop = base_loop.get_loop()
+        loop = _get_loop()
 
-    waiter = loop.create_future()
-
-    if inspect.iscoroutine(fut):
+    if isinstance(fut, _CoroType):
         fut = loop.create_task(fut)
-    
+    elif fut.done():
+        return fut.result()
+
+    waiter = loop.create_future()
     handle = loop.call_later(timeout, waiter.set_result, False)
 
-    def _done(fut):
-        waiter.set_result(True)
-    
-    fut.add_done_callback(_done)
+    _done = functools.partial(_wait_for_done, waiter, handle)
+    fut._add_callback(_done)
 
     res = await waiter
     if res:
         return fut.result()
-    else:
-        raise RuntimeError("Timed out")
+    if not fut.done():
+        fut.remove_done_callback(_done)
+        fut.cancel()
+    raise RuntimeError("Timed out")
@@ -9,10 +9,6 @@ async def counter():
 
 async def main():
 
-    tasks = []
-    for _ in range(5):
-        tasks.append(counter())
-
-    await areo.wait(tasks)
+    await areo.wait(counter() for _ in range(5))
 
 loop.run_until_done(main())
\ No newline at end of file